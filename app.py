@@ -1,32 +1,108 @@
 import streamlit as st
-from backend.script_generator import generate_script
-from backend.blueprint_generator import generate_blueprint
-from backend.visual_pattern_analyzer import VisualPatternAnalyzer
-from backend.quality_assessor import VideoQualityAssessor
-from backend.export_manager import ExportManager
-from video_engine.enhanced_synthesis import VideoSynthesizer
-from video_engine.simple_video_generator import SimpleVideoGenerator
 import os
-import traceback
+import asyncio
 from dotenv import load_dotenv
-import json
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Initialize analyzers
-pattern_analyzer = VisualPatternAnalyzer()
-quality_assessor = VideoQualityAssessor()
-video_synthesizer = VideoSynthesizer()
-simple_video_gen = SimpleVideoGenerator()
-export_manager = ExportManager()
-
 st.set_page_config(
     page_title="AI Video Generator Pro",
     page_icon="🎬",
     layout="wide"
 )
 
+
+# Analyzers are built once per process and shared across reruns and sessions.
+# Backend imports (moviepy, PIL, numpy, ...) are deferred until first use so
+# plain reruns, like typing in the topic box, don't pay for them.
+@st.cache_resource
+def get_pattern_analyzer():
+    from backend.visual_pattern_analyzer import VisualPatternAnalyzer
+    return VisualPatternAnalyzer()
+
+
+@st.cache_resource
+def get_quality_assessor():
+    from backend.quality_assessor import VideoQualityAssessor
+    return VideoQualityAssessor()
+
+
+@st.cache_resource
+def get_video_synthesizer():
+    from video_engine.enhanced_synthesis import VideoSynthesizer
+    return VideoSynthesizer()
+
+
+@st.cache_resource
+def get_simple_video_generator():
+    from video_engine.simple_video_generator import SimpleVideoGenerator
+    return SimpleVideoGenerator()
+
+
+@st.cache_resource
+def get_export_manager():
+    from backend.export_manager import ExportManager
+    return ExportManager()
+
+
+async def analyze_and_blueprint(script):
+    """Run pattern analysis and blueprint generation concurrently"""
+    from backend.blueprint_generator import generate_blueprint
+
+    # The blueprint request runs on a worker thread so it reuses the pooled Groq session
+    visual_blueprint, pattern_analysis = await asyncio.gather(
+        asyncio.to_thread(generate_blueprint, script),
+        asyncio.to_thread(get_pattern_analyzer().analyze_content, script)
+    )
+    return pattern_analysis, visual_blueprint
+
+
+async def stream_script_to(placeholder, topic):
+    """Render script tokens as they stream in, reading the response on a worker thread"""
+    from backend.script_generator import stream_script
+
+    tokens = stream_script(topic)
+    script = ""
+    while (token := await asyncio.to_thread(next, tokens, None)) is not None:
+        script += token
+        placeholder.markdown(script)
+    return script
+
+
+def render_script(topic):
+    """Generate the script for a topic, showing tokens as they stream in"""
+    # Not wrapped in st.cache_data: Streamlit would record every streamed markdown update
+    # and replay them all on each hit. Repeated topics are served whole by the disk cache.
+    script_placeholder = st.empty()
+    script = asyncio.run(stream_script_to(script_placeholder, topic))
+    script_placeholder.empty()
+    return script
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def cached_analysis_and_blueprint(script):
+    """Pattern analysis and blueprint for a script, reused for repeated topics"""
+    return asyncio.run(analyze_and_blueprint(script))
+
+
+@st.fragment
+def video_download_button(video_path):
+    """Video download button; clicking it reruns only this fragment, not the whole pipeline"""
+    def read_video():
+        with open(video_path, 'rb') as video_file:
+            return video_file.read()
+    
+    # A callable is only run when the button is clicked, so page renders don't load the MP4
+    st.download_button(
+        label="🎥 Video",
+        data=read_video,
+        file_name=os.path.basename(video_path),
+        mime="video/mp4",
+        use_container_width=True
+    )
+
+
 st.title("🎬 AI Video Generator")
 st.caption("Create educational videos with AI")
 
@@ -59,8 +135,7 @@ if generate_btn:
         
         try:
             # Step 1: Generate script
-            with st.spinner("🎬 Generating script with Groq AI..."):
-                script = generate_script(topic)
+            script = render_script(topic)
             
             st.success("✅ Script generated!")
             
@@ -68,16 +143,11 @@ if generate_btn:
             with st.expander("📝 View Generated Script", expanded=False):
                 st.text_area("Script", script, height=200, key="script_display", label_visibility="collapsed")
             
-            # Step 2: Analyze visual patterns
-            with st.spinner("🔍 Analyzing visual learning patterns..."):
-                pattern_analysis = pattern_analyzer.analyze_content(script)
+            # Step 2 + 3: Analyze visual patterns and generate blueprint (both only need the script)
+            with st.spinner("🔍 Analyzing visual patterns and generating animation blueprint..."):
+                pattern_analysis, visual_blueprint = cached_analysis_and_blueprint(script)
             
             st.success(f"✅ Detected pattern: **{pattern_analysis['primary_visual_pattern'].upper()}**")
-            
-            # Step 3: Generate blueprint
-            with st.spinner("📐 Generating enhanced animation blueprint..."):
-                visual_blueprint = generate_blueprint(script)
-            
             st.success("✅ Blueprint generated!")
             
             with st.expander("📐 View Animation Blueprint", expanded=False):
@@ -86,7 +156,7 @@ if generate_btn:
             # Step 4: Synthesize video
             with st.spinner("🎥 Generating MP4 video..."):
                 # Use simple video generator to create actual MP4
-                video_result = simple_video_gen.generate_from_analysis(topic, script, pattern_analysis)
+                video_result = get_simple_video_generator().generate_from_analysis(topic, script, pattern_analysis)
                 
                 synthesis_result = {
                     'video_path': video_result['video_path'],
@@ -95,6 +165,8 @@ if generate_btn:
             
             st.success(f"✅ Video generated successfully! ({video_result['duration']:.1f}s)")
             
+            video_exists = os.path.exists(synthesis_result['video_path'])
+            
             # Step 5: Quality Assessment
             with st.spinner("📊 Assessing video quality..."):
                 video_metadata = {
@@ -103,16 +175,17 @@ if generate_btn:
                     'concept_count': len(pattern_analysis['key_concepts'])
                 }
                 
-                quality_assessment = quality_assessor.assess_video(
+                quality_assessment = get_quality_assessor().assess_video(
                     synthesis_result['video_path'],
-                    video_metadata
+                    video_metadata,
+                    video_exists=video_exists
                 )
             
             rating = quality_assessment.get('rating', 'Good')
             st.success(f"✅ Quality Assessment: **{rating}**")
             
             # Display video if exists
-            if os.path.exists(synthesis_result['video_path']):
+            if video_exists:
                 st.success("🎉 Video Generated Successfully!")
                 st.video(synthesis_result['video_path'])
             else:
@@ -145,15 +218,8 @@ if generate_btn:
             
             with col_e3:
                 # Download video if exists
-                if os.path.exists(synthesis_result['video_path']):
-                    with open(synthesis_result['video_path'], 'rb') as video_file:
-                        st.download_button(
-                            label="🎥 Video",
-                            data=video_file.read(),
-                            file_name=os.path.basename(synthesis_result['video_path']),
-                            mime="video/mp4",
-                            use_container_width=True
-                        )
+                if video_exists:
+                    video_download_button(synthesis_result['video_path'])
             
             # Save session data
             if 'generated_videos' not in st.session_state:
@@ -1,23 +1,17 @@
-import requests
-import os
-from dotenv import load_dotenv
+from pathlib import Path
+from backend.groq_client import post_completion
 
-load_dotenv()
+# The prompt template is static, so read it once and split around the placeholder.
+# Resolved from this file so importing the module works from any working directory.
+_PROMPT_PATH = Path(__file__).resolve().parent.parent / "prompts" / "blueprint_prompt.txt"
+with open(_PROMPT_PATH, "r") as f:
+    _PROMPT_PREFIX, _, _PROMPT_SUFFIX = f.read().partition("{script}")
 
-# Groq API configuration (Free and Fast)
-GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
-GROQ_API_KEY = os.getenv('GROQ_API_KEY')
 
-def generate_blueprint(script):
-    with open("prompts/blueprint_prompt.txt", "r") as f:
-        prompt = f.read().format(script=script)
+def _build_payload(script):
+    prompt = _PROMPT_PREFIX + script + _PROMPT_SUFFIX
 
-    headers = {
-        "Authorization": f"Bearer {GROQ_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
+    return {
         "model": "llama-3.3-70b-versatile",
         "messages": [
             {"role": "system", "content": "You are an expert animator who creates detailed animation blueprints for educational videos."},
@@ -26,14 +20,10 @@ def generate_blueprint(script):
         "temperature": 0.3,
         "max_tokens": 800
     }
-    
-    try:
-        response = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-        result = response.json()
-        return result['choices'][0]['message']['content']
-    except Exception as e:
-        raise Exception(f"Groq API error: {str(e)}. Get free API key at https://console.groq.com")
+
+
+def generate_blueprint(script):
+    return post_completion(_build_payload(script))
 
 
 if __name__ == "__main__":
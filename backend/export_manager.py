@@ -3,12 +3,19 @@ Export and Download Module
 Handles exporting videos, reports, and data
 """
 
-import json
+import orjson
+import os
 import zipfile
 from pathlib import Path
 from datetime import datetime
 import base64
 
+# Same indented layout as json.dump(..., indent=2), also accepting numpy values
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+# Zip members smaller than this (bytes) are stored, since deflating them costs more CPU than it saves
+STORE_THRESHOLD = 4096
+
 class ExportManager:
     """Manages export and download functionality"""
     
@@ -34,24 +41,6 @@ class ExportManager:
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         project_name = f"{topic.replace(' ', '_')}_{timestamp}"
-        project_dir = self.exports_dir / project_name
-        project_dir.mkdir(exist_ok=True)
-        
-        # Save script
-        with open(project_dir / "script.txt", 'w', encoding='utf-8') as f:
-            f.write(script)
-        
-        # Save blueprint
-        with open(project_dir / "blueprint.txt", 'w', encoding='utf-8') as f:
-            f.write(blueprint)
-        
-        # Save analysis as JSON
-        with open(project_dir / "analysis.json", 'w', encoding='utf-8') as f:
-            json.dump(analysis, f, indent=2)
-        
-        # Save quality assessment
-        with open(project_dir / "quality_report.json", 'w', encoding='utf-8') as f:
-            json.dump(quality_assessment, f, indent=2)
         
         # Create README
         readme_content = f"""# {topic}
@@ -79,18 +68,22 @@ Rating: {quality_assessment.get('rating', 'N/A')}
 {', '.join(analysis.get('key_concepts', []))}
 """
         
-        with open(project_dir / "README.md", 'w', encoding='utf-8') as f:
-            f.write(readme_content)
-        
-        # Create zip file
+        # Write each file straight into the zip; the contents are small text, so favour speed over ratio
         zip_path = self.exports_dir / f"{project_name}.zip"
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file in project_dir.rglob('*'):
-                if file.is_file():
-                    zipf.write(file, file.relative_to(project_dir))
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+            self._write_member(zipf, "script.txt", script.encode('utf-8'))
+            self._write_member(zipf, "blueprint.txt", blueprint.encode('utf-8'))
+            self._write_member(zipf, "analysis.json", orjson.dumps(analysis, option=JSON_OPTIONS))
+            self._write_member(zipf, "quality_report.json", orjson.dumps(quality_assessment, option=JSON_OPTIONS))
+            self._write_member(zipf, "README.md", readme_content.encode('utf-8'))
         
         return zip_path
     
+    def _write_member(self, zipf, name, data):
+        """Add data to the zip, storing small members uncompressed"""
+        compress_type = zipfile.ZIP_STORED if len(data) < STORE_THRESHOLD else zipfile.ZIP_DEFLATED
+        zipf.writestr(name, data, compress_type=compress_type)
+    
     def get_download_link(self, file_path, link_text="Download"):
         """
         Generate a download link for Streamlit
@@ -127,8 +120,8 @@ Rating: {quality_assessment.get('rating', 'N/A')}
             'videos': video_history
         }
         
-        with open(analytics_file, 'w', encoding='utf-8') as f:
-            json.dump(analytics_data, f, indent=2)
+        with open(analytics_file, 'wb') as f:
+            f.write(orjson.dumps(analytics_data, option=JSON_OPTIONS))
         
         return analytics_file
     
@@ -140,15 +133,21 @@ Rating: {quality_assessment.get('rating', 'N/A')}
             days: Number of days to keep exports
         """
         cutoff = datetime.now().timestamp() - (days * 24 * 60 * 60)
-        
-        for file in self.exports_dir.rglob('*'):
-            if file.is_file() and file.stat().st_mtime < cutoff:
-                file.unlink()
-        
-        # Remove empty directories
-        for dir in self.exports_dir.rglob('*'):
-            if dir.is_dir() and not list(dir.iterdir()):
-                dir.rmdir()
+        self._remove_old_entries(self.exports_dir, cutoff)
+    
+    def _remove_old_entries(self, directory, cutoff):
+        """Delete files older than cutoff in a single bottom-up walk, removing directories left empty"""
+        # scandir entries carry their type (and on Windows their stat) from the directory read itself
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    self._remove_old_entries(entry.path, cutoff)
+                    try:
+                        os.rmdir(entry.path)
+                    except OSError:
+                        pass  # Still has recent files
+                elif entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    os.unlink(entry.path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,177 @@
+"""
+Groq API Client Module
+Shared request helpers for the script and blueprint generators
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+import orjson
+import hashlib
+import tempfile
+import time
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Groq API configuration (Free and Fast)
+GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
+GROQ_API_KEY = os.getenv('GROQ_API_KEY')
+GROQ_TIMEOUT = 30
+
+# Completions are cached on disk by request content, so repeated prompts survive restarts.
+# Entries older than LLM_CACHE_MAX_AGE seconds are regenerated; 0 disables the cache.
+LLM_CACHE_DIR = Path(__file__).resolve().parent.parent / ".llm_cache"
+LLM_CACHE_MAX_AGE = int(os.getenv('LLM_CACHE_MAX_AGE', 24 * 60 * 60))
+
+_HEADERS = {
+    "Authorization": f"Bearer {GROQ_API_KEY}",
+    "Content-Type": "application/json"
+}
+
+# One pooled session so keep-alive connections (and the TLS handshake) are reused across calls
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["POST"]
+    )
+))
+
+
+def _groq_error(e):
+    return Exception(f"Groq API error: {str(e)}. Get free API key at https://console.groq.com")
+
+
+def _cache_path(payload):
+    """Content-addressed cache file for a request payload"""
+    key = hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return LLM_CACHE_DIR / f"{key}.txt"
+
+
+# The cache is only an optimization: any problem reading or writing it is treated
+# as a miss, never as a failure of a request that would otherwise succeed
+def _read_cache(path):
+    if LLM_CACHE_MAX_AGE <= 0:
+        return None
+    try:
+        if time.time() - path.stat().st_mtime > LLM_CACHE_MAX_AGE:
+            return None
+        return path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _write_cache(path, content):
+    if LLM_CACHE_MAX_AGE <= 0:
+        return
+    tmp_path = None
+    try:
+        path.parent.mkdir(exist_ok=True)
+        # Write to a temp file and rename, so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def post_completion(payload):
+    """Send a chat completion request and return the message content"""
+    cache_path = _cache_path(payload)
+    content = _read_cache(cache_path)
+    if content is not None:
+        return content
+    
+    try:
+        response = _SESSION.post(GROQ_API_URL, json=payload, timeout=GROQ_TIMEOUT)
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        content = result['choices'][0]['message']['content']
+    except Exception as e:
+        raise _groq_error(e)
+    
+    if content:
+        _write_cache(cache_path, content)
+    return content
+
+
+def stream_completion(payload):
+    """Stream a chat completion, yielding content tokens as they arrive"""
+    cache_path = _cache_path(payload)
+    content = _read_cache(cache_path)
+    if content is not None:
+        yield content
+        return
+    
+    tokens = []
+    finished = False
+    try:
+        with _SESSION.post(GROQ_API_URL, json={**payload, "stream": True},
+                           timeout=GROQ_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                # Server-sent events: "data: {...}" lines, terminated by "data: [DONE]"
+                if not line.startswith(b"data: "):
+                    continue
+                data = line[len(b"data: "):]
+                if data == b"[DONE]":
+                    finished = True
+                    break
+                token = orjson.loads(data)['choices'][0]['delta'].get('content')
+                if token:
+                    tokens.append(token)
+                    yield token
+    except Exception as e:
+        raise _groq_error(e)
+    
+    # A stream that ended without [DONE] was cut off; caching it would serve the partial text forever
+    content = "".join(tokens)
+    if finished and content:
+        _write_cache(cache_path, content)
+
+
+def async_client(max_connections=20):
+    """Create an httpx client that can be shared across concurrent requests"""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=GROQ_TIMEOUT,
+        limits=httpx.Limits(max_connections=max_connections)
+    )
+
+
+async def apost_completion(payload, client=None):
+    """Async variant of post_completion using httpx"""
+    cache_path = _cache_path(payload)
+    content = _read_cache(cache_path)
+    if content is not None:
+        return content
+    
+    try:
+        if client is None:
+            async with async_client() as client:
+                response = await client.post(GROQ_API_URL, headers=_HEADERS, json=payload)
+        else:
+            response = await client.post(GROQ_API_URL, headers=_HEADERS, json=payload)
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        content = result['choices'][0]['message']['content']
+    except Exception as e:
+        raise _groq_error(e)
+    
+    if content:
+        _write_cache(cache_path, content)
+    return content
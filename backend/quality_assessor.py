@@ -4,8 +4,56 @@ Analyzes generated videos for quality metrics and learning effectiveness
 """
 
 from pathlib import Path
-from typing import Dict
-import json
+from typing import Dict, Optional
+import bisect
+
+# Overall rating bands: below 0.6, [0.6, 0.7), [0.7, 0.8), 0.8 and above
+RATING_THRESHOLDS = (0.6, 0.7, 0.8)
+RATINGS = ('Needs Improvement', 'Fair', 'Good', 'Excellent')
+
+# Quality report templates
+REPORT_RULE = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+
+REPORT_HEADER = """
+╔══════════════════════════════════════════════════════╗
+║       VIDEO QUALITY ASSESSMENT REPORT                 ║
+╚══════════════════════════════════════════════════════╝
+
+Overall Rating: {rating}
+Overall Score: {score:.1%}
+
+""" + REPORT_RULE + """
+METRICS BREAKDOWN
+""" + REPORT_RULE + "\n"
+
+REPORT_METRIC = """
+{icon} {name}
+  Score: {score:.1%}
+  {message}
+"""
+
+REPORT_SECTION = "\n" + REPORT_RULE + "\n{title}\n" + REPORT_RULE + "\n"
+
+
+def _band_scorer(lower_edges, upper_edges, bands):
+    """
+    Build a scoring function for fixed thresholds
+    
+    Args:
+        lower_edges: Ascending thresholds a value moves past once it reaches them (>=)
+        upper_edges: Ascending thresholds a value moves past once it exceeds them (>)
+        bands: (score, status, message template) per band, lowest values first
+    
+    Returns:
+        Function mapping a value to a metric dict
+    """
+    def score(value):
+        band = bisect.bisect_right(lower_edges, value) + bisect.bisect_left(upper_edges, value)
+        band_score, status, message = bands[band]
+        return {'score': band_score, 'status': status, 'message': message.format(value=value)}
+    
+    return score
+
 
 class VideoQualityAssessor:
     """Assesses video quality and learning effectiveness"""
@@ -17,19 +65,68 @@ class VideoQualityAssessor:
             'concept_clarity': {'min': 0.6, 'optimal': 0.8},
             'pacing': {'optimal': (3, 8)}  # seconds per scene
         }
+        
+        # Thresholds are fixed from here on, so bake them into the per-metric scorers
+        duration = self.quality_thresholds['duration']
+        optimal_min, optimal_max = duration['optimal']
+        self._score_duration = _band_scorer(
+            (duration['min'], optimal_min), (optimal_max, duration['max']),
+            (
+                (0.4, 'too_short', f'Video is too short ({{value}}s). Recommended: {optimal_min}-{optimal_max}s'),
+                (0.8, 'acceptable', 'Duration is acceptable ({value}s)'),
+                (1.0, 'optimal', 'Duration is optimal ({value}s)'),
+                (0.8, 'acceptable', 'Duration is acceptable ({value}s)'),
+                (0.6, 'too_long', 'Video is too long ({value}s). Consider breaking into parts')
+            )
+        )
+        
+        scene_count = self.quality_thresholds['scene_count']
+        optimal_min, optimal_max = scene_count['optimal']
+        self._score_scene_count = _band_scorer(
+            (scene_count['min'], optimal_min), (optimal_max, scene_count['max']),
+            (
+                (0.5, 'too_few', 'Too few scenes ({value}). Add more visual variety'),
+                (0.8, 'acceptable', 'Scene count is acceptable ({value} scenes)'),
+                (1.0, 'optimal', 'Scene count is optimal ({value} scenes)'),
+                (0.8, 'acceptable', 'Scene count is acceptable ({value} scenes)'),
+                (0.6, 'too_many', 'Too many scenes ({value}). May feel rushed')
+            )
+        )
+        
+        optimal_min, optimal_max = self.quality_thresholds['pacing']['optimal']
+        self._score_pacing = _band_scorer(
+            (optimal_min,), (optimal_max,),
+            (
+                (0.6, 'too_fast', 'Pacing is too fast ({value:.1f}s per scene). Learners may struggle'),
+                (1.0, 'optimal', 'Pacing is optimal ({value:.1f}s per scene)'),
+                (0.7, 'too_slow', 'Pacing is slow ({value:.1f}s per scene). May lose attention')
+            )
+        )
+        
+        # Concepts per minute
+        self._score_clarity = _band_scorer(
+            (1,), (8,),
+            (
+                (0.7, 'low_density', 'Low concept density. Consider adding more information'),
+                (1.0, 'optimal', 'Content clarity is optimal ({value:.1f} concepts/min)'),
+                (0.6, 'high_density', 'High concept density. May overwhelm learners')
+            )
+        )
     
-    def assess_video(self, video_path: str, metadata: Dict) -> Dict:
+    def assess_video(self, video_path: str, metadata: Dict, video_exists: Optional[bool] = None) -> Dict:
         """
         Assess video quality based on multiple metrics
         
         Args:
             video_path: Path to the video file
             metadata: Video metadata including duration, scenes, etc.
+            video_exists: Whether the video file exists, if the caller already checked
         
         Returns:
             Dictionary with quality assessment results
         """
-        video_file = Path(video_path)
+        if video_exists is None:
+            video_exists = Path(video_path).exists()
         
         assessment = {
             'overall_score': 0.8,  # Default good score
@@ -41,7 +138,7 @@ class VideoQualityAssessor:
         }
         
         # Check if video exists
-        if not video_file.exists():
+        if not video_exists:
             assessment['metrics']['file_exists'] = {
                 'score': 0,
                 'status': 'fail',
@@ -74,114 +171,37 @@ class VideoQualityAssessor:
         clarity_score = self._assess_clarity(concept_count, duration)
         assessment['metrics']['content_clarity'] = clarity_score
         
-        # Calculate overall score
-        metric_scores = [m['score'] for m in assessment['metrics'].values()]
-        assessment['overall_score'] = sum(metric_scores) / len(metric_scores) if metric_scores else 0
-        
-        # Generate recommendations
-        assessment['recommendations'] = self._generate_recommendations(assessment['metrics'])
-        
-        # Identify strengths and weaknesses
+        # Calculate overall score and identify strengths and weaknesses in one pass
+        total = 0.0
         for metric_name, metric_data in assessment['metrics'].items():
-            if metric_data['score'] >= 0.8:
+            score = metric_data['score']
+            total += score
+            if score >= 0.8:
                 assessment['strengths'].append(metric_name)
-            elif metric_data['score'] < 0.6:
+            elif score < 0.6:
                 assessment['weaknesses'].append(metric_name)
+        metric_count = len(assessment['metrics'])
+        assessment['overall_score'] = total / metric_count if metric_count else 0
+        
+        # Generate recommendations
+        assessment['recommendations'] = self._generate_recommendations(assessment['metrics'])
         
         # Determine overall rating
-        if assessment['overall_score'] >= 0.8:
-            assessment['rating'] = 'Excellent'
-        elif assessment['overall_score'] >= 0.7:
-            assessment['rating'] = 'Good'
-        elif assessment['overall_score'] >= 0.6:
-            assessment['rating'] = 'Fair'
-        else:
-            assessment['rating'] = 'Needs Improvement'
+        assessment['rating'] = RATINGS[bisect.bisect_right(RATING_THRESHOLDS, assessment['overall_score'])]
         
         return assessment
     
     def _assess_duration(self, duration: float) -> Dict:
         """Assess video duration"""
-        thresholds = self.quality_thresholds['duration']
-        optimal_min, optimal_max = thresholds['optimal']
-        
-        if duration < thresholds['min']:
-            return {
-                'score': 0.4,
-                'status': 'too_short',
-                'message': f'Video is too short ({duration}s). Recommended: {optimal_min}-{optimal_max}s'
-            }
-        elif duration > thresholds['max']:
-            return {
-                'score': 0.6,
-                'status': 'too_long',
-                'message': f'Video is too long ({duration}s). Consider breaking into parts'
-            }
-        elif optimal_min <= duration <= optimal_max:
-            return {
-                'score': 1.0,
-                'status': 'optimal',
-                'message': f'Duration is optimal ({duration}s)'
-            }
-        else:
-            return {
-                'score': 0.8,
-                'status': 'acceptable',
-                'message': f'Duration is acceptable ({duration}s)'
-            }
+        return self._score_duration(duration)
     
     def _assess_scene_count(self, scene_count: int) -> Dict:
         """Assess number of scenes"""
-        thresholds = self.quality_thresholds['scene_count']
-        optimal_min, optimal_max = thresholds['optimal']
-        
-        if scene_count < thresholds['min']:
-            return {
-                'score': 0.5,
-                'status': 'too_few',
-                'message': f'Too few scenes ({scene_count}). Add more visual variety'
-            }
-        elif scene_count > thresholds['max']:
-            return {
-                'score': 0.6,
-                'status': 'too_many',
-                'message': f'Too many scenes ({scene_count}). May feel rushed'
-            }
-        elif optimal_min <= scene_count <= optimal_max:
-            return {
-                'score': 1.0,
-                'status': 'optimal',
-                'message': f'Scene count is optimal ({scene_count} scenes)'
-            }
-        else:
-            return {
-                'score': 0.8,
-                'status': 'acceptable',
-                'message': f'Scene count is acceptable ({scene_count} scenes)'
-            }
+        return self._score_scene_count(scene_count)
     
     def _assess_pacing(self, pacing: float) -> Dict:
         """Assess video pacing (seconds per scene)"""
-        optimal_min, optimal_max = self.quality_thresholds['pacing']['optimal']
-        
-        if pacing < optimal_min:
-            return {
-                'score': 0.6,
-                'status': 'too_fast',
-                'message': f'Pacing is too fast ({pacing:.1f}s per scene). Learners may struggle'
-            }
-        elif pacing > optimal_max:
-            return {
-                'score': 0.7,
-                'status': 'too_slow',
-                'message': f'Pacing is slow ({pacing:.1f}s per scene). May lose attention'
-            }
-        else:
-            return {
-                'score': 1.0,
-                'status': 'optimal',
-                'message': f'Pacing is optimal ({pacing:.1f}s per scene)'
-            }
+        return self._score_pacing(pacing)
     
     def _assess_clarity(self, concept_count: int, duration: float) -> Dict:
         """Assess content clarity based on concept density"""
@@ -189,25 +209,7 @@ class VideoQualityAssessor:
             return {'score': 0, 'status': 'unknown', 'message': 'Cannot assess clarity'}
         
         concepts_per_minute = (concept_count / duration) * 60
-        
-        if concepts_per_minute < 1:
-            return {
-                'score': 0.7,
-                'status': 'low_density',
-                'message': 'Low concept density. Consider adding more information'
-            }
-        elif concepts_per_minute > 8:
-            return {
-                'score': 0.6,
-                'status': 'high_density',
-                'message': 'High concept density. May overwhelm learners'
-            }
-        else:
-            return {
-                'score': 1.0,
-                'status': 'optimal',
-                'message': f'Content clarity is optimal ({concepts_per_minute:.1f} concepts/min)'
-            }
+        return self._score_clarity(concepts_per_minute)
     
     def _generate_recommendations(self, metrics: Dict) -> list:
         """Generate actionable recommendations based on metrics"""
@@ -246,46 +248,26 @@ class VideoQualityAssessor:
     
     def generate_report(self, assessment: Dict) -> str:
         """Generate a human-readable quality report"""
-        report = f"""
-╔══════════════════════════════════════════════════════╗
-║       VIDEO QUALITY ASSESSMENT REPORT                 ║
-╚══════════════════════════════════════════════════════╝
-
-Overall Rating: {assessment['rating']}
-Overall Score: {assessment['overall_score']:.1%}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-METRICS BREAKDOWN
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+        parts = [REPORT_HEADER.format(rating=assessment['rating'], score=assessment['overall_score'])]
         
         for metric_name, metric_data in assessment['metrics'].items():
             status_icon = "✓" if metric_data['score'] >= 0.8 else "⚠" if metric_data['score'] >= 0.6 else "✗"
-            report += f"\n{status_icon} {metric_name.upper()}\n"
-            report += f"  Score: {metric_data['score']:.1%}\n"
-            report += f"  {metric_data['message']}\n"
+            parts.append(REPORT_METRIC.format(
+                icon=status_icon, name=metric_name.upper(), score=metric_data['score'], message=metric_data['message']
+            ))
         
         if assessment['strengths']:
-            report += f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            report += "STRENGTHS\n"
-            report += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            for strength in assessment['strengths']:
-                report += f"  ✓ {strength.replace('_', ' ').title()}\n"
+            parts.append(REPORT_SECTION.format(title="STRENGTHS"))
+            parts.extend(f"  ✓ {strength.replace('_', ' ').title()}\n" for strength in assessment['strengths'])
         
         if assessment['weaknesses']:
-            report += f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            report += "AREAS FOR IMPROVEMENT\n"
-            report += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-            for weakness in assessment['weaknesses']:
-                report += f"  ⚠ {weakness.replace('_', ' ').title()}\n"
+            parts.append(REPORT_SECTION.format(title="AREAS FOR IMPROVEMENT"))
+            parts.extend(f"  ⚠ {weakness.replace('_', ' ').title()}\n" for weakness in assessment['weaknesses'])
         
-        report += f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        report += "RECOMMENDATIONS\n"
-        report += "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        for i, rec in enumerate(assessment['recommendations'], 1):
-            report += f"  {i}. {rec}\n"
+        parts.append(REPORT_SECTION.format(title="RECOMMENDATIONS"))
+        parts.extend(f"  {i}. {rec}\n" for i, rec in enumerate(assessment['recommendations'], 1))
         
-        return report
+        return "".join(parts)
 
 
 if __name__ == "__main__":
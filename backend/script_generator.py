@@ -1,23 +1,18 @@
-import requests
-import os
-from dotenv import load_dotenv
+import asyncio
+from pathlib import Path
+from backend.groq_client import post_completion, stream_completion, apost_completion, async_client
 
-load_dotenv()
+# The prompt template is static, so read it once and split around the placeholder.
+# Resolved from this file so importing the module works from any working directory.
+_PROMPT_PATH = Path(__file__).resolve().parent.parent / "prompts" / "script_prompt.txt"
+with open(_PROMPT_PATH, "r") as f:
+    _PROMPT_PREFIX, _, _PROMPT_SUFFIX = f.read().partition("{topic}")
 
-# Groq API configuration (Free and Fast)
-GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
-GROQ_API_KEY = os.getenv('GROQ_API_KEY')
 
-def generate_script(topic):
-    with open("prompts/script_prompt.txt", "r") as f:
-        prompt = f.read().format(topic=topic)
+def _build_payload(topic):
+    prompt = _PROMPT_PREFIX + topic + _PROMPT_SUFFIX
 
-    headers = {
-        "Authorization": f"Bearer {GROQ_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
+    return {
         "model": "llama-3.3-70b-versatile",
         "messages": [
             {"role": "system", "content": "You are an expert educational content creator who writes engaging video scripts."},
@@ -26,14 +21,34 @@ def generate_script(topic):
         "temperature": 0.7,
         "max_tokens": 1000
     }
-    
-    try:
-        response = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-        result = response.json()
-        return result['choices'][0]['message']['content']
-    except Exception as e:
-        raise Exception(f"Groq API error: {str(e)}. Get free API key at https://console.groq.com")
+
+
+def generate_script(topic):
+    return post_completion(_build_payload(topic))
+
+
+def stream_script(topic):
+    """Yield script tokens as they are generated"""
+    return stream_completion(_build_payload(topic))
+
+
+async def agenerate_script(topic, client=None, semaphore=None):
+    """Async variant of generate_script, optionally bounded by a semaphore"""
+    if semaphore is None:
+        return await apost_completion(_build_payload(topic), client)
+    async with semaphore:
+        return await apost_completion(_build_payload(topic), client)
+
+
+async def _agenerate_scripts(topics, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    async with async_client(max_connections=concurrency) as client:
+        return await asyncio.gather(*[agenerate_script(topic, client, semaphore) for topic in topics])
+
+
+def generate_scripts_batch(topics, concurrency=10):
+    """Generate scripts for several topics concurrently, in input order"""
+    return asyncio.run(_agenerate_scripts(topics, concurrency))
 
 
 if __name__ == "__main__":
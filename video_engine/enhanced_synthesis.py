@@ -4,7 +4,7 @@ Integrates visual pattern analysis with scene generation
 """
 
 from manim import *
-import json
+import orjson
 from pathlib import Path
 
 class EnhancedVideoScene(Scene):
@@ -29,14 +29,22 @@ class EnhancedVideoScene(Scene):
         """Create animated bullet points"""
         bullets = VGroup()
         
-        for i, point in enumerate(points):
+        # Row heights for every bullet at once; x comes from the left edge alignment
+        rows_y = 2 - 0.8 * np.arange(len(points))
+        
+        for point, y in zip(points, rows_y):
             bullet = Text(f"• {point}", font_size=28)
             bullet.to_edge(LEFT, buff=1)
-            bullet.shift(UP * (2 - i * 0.8))
+            bullet.set_y(y)
             bullets.add(bullet)
         
-        for bullet in bullets:
-            self.play(FadeIn(bullet, shift=RIGHT), run_time=0.5)
+        # One play call for all bullets, so Manim writes a single partial movie file;
+        # lag_ratio=1 keeps them appearing one after another, 0.5s each
+        if bullets:
+            self.play(
+                LaggedStart(*[FadeIn(bullet, shift=RIGHT) for bullet in bullets], lag_ratio=1),
+                run_time=len(bullets) * 0.5
+            )
         
         self.wait(duration - len(points) * 0.5)
         self.play(FadeOut(bullets), run_time=0.5)
@@ -50,13 +58,17 @@ class EnhancedVideoScene(Scene):
         spacing = 2.5
         start_x = -(num_steps - 1) * spacing / 2
         
+        # Box centers along the x axis, computed once
+        centers = np.zeros((num_steps, 3))
+        centers[:, 0] = start_x + spacing * np.arange(num_steps)
+        
         for i, step in enumerate(steps):
             box = Rectangle(width=2, height=1, color=BLUE, fill_opacity=0.3)
             text = Text(step, font_size=20)
             text.move_to(box.get_center())
             
             box_group = VGroup(box, text)
-            box_group.shift(RIGHT * (start_x + i * spacing))
+            box_group.move_to(centers[i])
             boxes.add(box_group)
             
             if i < num_steps - 1:
@@ -68,26 +80,31 @@ class EnhancedVideoScene(Scene):
                 )
                 arrows.add(arrow)
         
-        for box in boxes:
-            self.play(FadeIn(box), run_time=0.5)
-        
-        for arrow in arrows:
-            self.play(Create(arrow), run_time=0.3)
+        # Boxes then arrows in a single play call, each keeping its own run time
+        if boxes:
+            self.play(LaggedStart(
+                *[FadeIn(box, run_time=0.5) for box in boxes],
+                *[Create(arrow, run_time=0.3) for arrow in arrows],
+                lag_ratio=1
+            ))
         
         self.wait(duration - (len(boxes) * 0.5 + len(arrows) * 0.3))
         self.play(FadeOut(boxes), FadeOut(arrows), run_time=0.5)
     
     def create_comparison(self, left_data, right_data, duration=5):
         """Create side-by-side comparison"""
+        # Shared row heights for the point lists on both sides
+        rows_y = 1 - 0.7 * np.arange(4)
+        
         # Left side
         left_title = Text(left_data['title'], font_size=32, color=BLUE)
         left_title.to_edge(LEFT, buff=1).shift(UP * 2)
         left_points = VGroup()
         
-        for i, point in enumerate(left_data.get('points', [])[:4]):
+        for point, y in zip(left_data.get('points', [])[:4], rows_y):
             text = Text(f"• {point}", font_size=20)
             text.to_edge(LEFT, buff=1.5)
-            text.shift(UP * (1 - i * 0.7))
+            text.set_y(y)
             left_points.add(text)
         
         # Right side
@@ -95,10 +112,10 @@ class EnhancedVideoScene(Scene):
         right_title.to_edge(RIGHT, buff=1).shift(UP * 2)
         right_points = VGroup()
         
-        for i, point in enumerate(right_data.get('points', [])[:4]):
+        for point, y in zip(right_data.get('points', [])[:4], rows_y):
             text = Text(f"• {point}", font_size=20)
             text.to_edge(RIGHT, buff=1.5)
-            text.shift(UP * (1 - i * 0.7))
+            text.set_y(y)
             right_points.add(text)
         
         # Divider
@@ -132,9 +149,11 @@ class EnhancedVideoScene(Scene):
 class VideoSynthesizer:
     """Synthesizes video from analyzed patterns and content"""
     
-    def __init__(self, output_dir="output"):
+    def __init__(self, output_dir="output", debug=False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # The config is read by the renderer; only indent it when a person will read it
+        self.json_options = orjson.OPT_INDENT_2 if debug else 0
     
     def synthesize_video(self, script, blueprint, analysis):
         """
@@ -157,8 +176,8 @@ class VideoSynthesizer:
         
         # Save configuration for rendering
         config_path = self.output_dir / "scene_config.json"
-        with open(config_path, 'w') as f:
-            json.dump(scene_config, f, indent=2)
+        with open(config_path, 'wb') as f:
+            f.write(orjson.dumps(scene_config, option=self.json_options))
         
         output_file = self.output_dir / "final_video.mp4"
         
@@ -14,7 +14,11 @@ class ExplainerScene(Scene):
 
         arrow = Arrow(client.get_right(), server.get_left())
 
-        self.play(Create(client), Write(client_text))
-        self.play(Create(server), Write(server_text))
+        # Client then server in one play call, so Manim writes one partial movie file
+        self.play(LaggedStart(
+            AnimationGroup(Create(client), Write(client_text)),
+            AnimationGroup(Create(server), Write(server_text)),
+            lag_ratio=1
+        ), run_time=2)
         self.play(GrowArrow(arrow))
         self.wait(2)
@@ -1,8 +1,51 @@
-"""Simple video generator using MoviePy to create actual MP4 videos"""
+"""Simple video generator that renders text with PIL and encodes MP4 videos with a direct ffmpeg call"""
 import os
-from moviepy import ImageClip, concatenate_videoclips
+import functools
+from concurrent.futures import ProcessPoolExecutor
+import platform
+import shutil
+import subprocess
+import tempfile
 from PIL import Image, ImageDraw, ImageFont
-import numpy as np
+import imageio_ffmpeg
+
+
+@functools.lru_cache(maxsize=32)
+def _get_font(size, bold):
+    """Load a font once per size and weight, since parsing the TTF file is not free"""
+    # Try to use a nice font, fall back to default
+    try:
+        return ImageFont.truetype("arialbd.ttf" if bold else "arial.ttf", size)  # Bold for titles
+    except:
+        return ImageFont.load_default()
+
+
+# Software fallback, available in every ffmpeg build
+SOFTWARE_ENCODER = ['-c:v', 'libx264', '-preset', 'ultrafast', '-tune', 'stillimage']
+
+# Hardware encoders that failed where libx264 then succeeded, so they aren't tried again
+_unusable_encoders = set()
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_hardware_encoder():
+    if shutil.which('nvidia-smi'):
+        return ('-c:v', 'h264_nvenc', '-preset', 'p1', '-tune', 'll')
+    if platform.system() == 'Darwin':
+        return ('-c:v', 'h264_videotoolbox', '-realtime', 'true')
+    return None
+
+
+def _hardware_encoder():
+    """Pick a hardware H.264 encoder for this machine, or None to use libx264"""
+    encoder = _detect_hardware_encoder()
+    return None if encoder in _unusable_encoders else encoder
+
+
+def _mark_hardware_encoder_unusable(encoder):
+    """Stop trying an encoder that the ffmpeg build or driver doesn't support"""
+    _unusable_encoders.add(encoder)
+
 
 class SimpleVideoGenerator:
     def __init__(self, output_dir="output"):
@@ -12,61 +55,131 @@ class SimpleVideoGenerator:
     def create_text_clip(self, text, duration=3, size=(1920, 1080), bg_color=(30, 30, 50), 
                         text_color=(255, 255, 255), font_size=60, is_title=False):
         """Create a text clip with given parameters"""
-        # Create image with text
+        # Only needed for clip composition; the title video is encoded by ffmpeg directly
+        from moviepy import ImageClip
+        import numpy as np
+        
+        img = self.render_text_image(text, size, bg_color, text_color, font_size, is_title)
+        
+        # Convert PIL image to numpy array
+        img_array = np.array(img)
+        
+        # Create video clip from image (no fade effects)
+        return ImageClip(img_array, duration=duration)
+    
+    def render_text_image(self, text, size=(1920, 1080), bg_color=(30, 30, 50),
+                          text_color=(255, 255, 255), font_size=60, is_title=False):
+        """Render word-wrapped, centered text onto a solid background image"""
         img = Image.new('RGB', size, color=bg_color)
-        draw = ImageDraw.Draw(img)
+        mask = self.render_text_mask(text, size, font_size, is_title)
+        # Fill the text color through the coverage mask; no RGBA intermediate is needed
+        x, y = self._center_offset(mask, size)
+        img.paste(text_color, (x, y, x + mask.width, y + mask.height), mask)
+        return img
+    
+    def render_text_layer(self, text, size=(1920, 1080), text_color=(255, 255, 255),
+                          font_size=60, is_title=False):
+        """Render word-wrapped, centered text on a transparent image just large enough to hold it"""
+        mask = self.render_text_mask(text, size, font_size, is_title)
+        layer = Image.new('RGBA', mask.size, color=text_color)
+        layer.putalpha(mask)
+        return layer
+    
+    def render_text_mask(self, text, size=(1920, 1080), font_size=60, is_title=False):
+        """Render word-wrapped, centered text as an 8-bit coverage mask just large enough to hold it"""
+        font = _get_font(font_size, is_title)
         
-        # Try to use a nice font, fall back to default
-        try:
-            if is_title:
-                font = ImageFont.truetype("arialbd.ttf", font_size)  # Bold for titles
-            else:
-                font = ImageFont.truetype("arial.ttf", font_size)
-        except:
-            font = ImageFont.load_default()
+        # Word wrap text on measured pixel widths, keeping a margin on both sides
+        lines = self._wrap_text(text, font, int(size[0] * 0.85))
         
-        # Word wrap text - split into lines
+        # Calculate positioning; advance widths are enough for wrapping, but the
+        # mask has to be sized from the ink, which can extend past the advance
+        line_height = font_size + 25
+        bboxes = [font.getbbox(line) for line in lines]
+        width = max((right - left for left, _, right, _ in bboxes), default=1)
+        top = min((i * line_height + bbox[1] for i, bbox in enumerate(bboxes)), default=0)
+        bottom = max((i * line_height + bbox[3] for i, bbox in enumerate(bboxes)), default=1)
+        height = max(bottom - top, 1)
+        
+        # Text is drawn into a single 8-bit channel, a quarter of the memory of RGBA
+        mask = Image.new('L', (width, height), color=0)
+        draw = ImageDraw.Draw(mask)
+        
+        # Draw each line centered, offset by its bbox so bearings and overhangs stay inside
+        for i, (line, (left, _, right, _)) in enumerate(zip(lines, bboxes)):
+            x = (width - (right - left)) // 2 - left
+            y = i * line_height - top
+            
+            draw.text((x, y), line, fill=255, font=font)
+        
+        return mask
+    
+    def _center_offset(self, layer, size):
+        return (size[0] - layer.width) // 2, (size[1] - layer.height) // 2
+    
+    def _wrap_text(self, text, font, max_width):
+        """Split text into lines no wider than max_width pixels"""
         words = text.split()
+        # Measure each word once, then wrap in a single pass over the widths
+        widths = [font.getlength(word) for word in words]
+        space_width = font.getlength(' ')
+        
         lines = []
-        current_line = []
-        max_chars = 35 if is_title else 45  # Shorter lines for titles
-        
-        for word in words:
-            current_line.append(word)
-            test_line = ' '.join(current_line)
-            if len(test_line) > max_chars:
-                if len(current_line) > 1:
-                    current_line.pop()
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(test_line)
-                    current_line = []
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        # Calculate positioning
-        line_height = font_size + 25
-        total_height = len(lines) * line_height
-        start_y = (size[1] - total_height) // 2
+        line_start = 0
+        line_width = 0
+        for i, width in enumerate(widths):
+            if i == line_start:
+                line_width = width
+            elif line_width + space_width + width > max_width:
+                lines.append(' '.join(words[line_start:i]))
+                line_start = i
+                line_width = width
+            else:
+                line_width += space_width + width
+        
+        if line_start < len(words):
+            lines.append(' '.join(words[line_start:]))
         
-        # Draw each line centered
-        for i, line in enumerate(lines):
-            bbox = draw.textbbox((0, 0), line, font=font)
-            text_width = bbox[2] - bbox[0]
+        return lines
+    
+    def write_text_video(self, text_layer, duration, output_path, size=(1920, 1080),
+                         bg_color=(30, 30, 50), fps=24):
+        """Encode a static text scene with ffmpeg"""
+        # ffmpeg generates the solid background itself and overlays the text layer,
+        # so Python never builds a full-frame image; a single-frame overlay input is
+        # held on its last frame for the whole duration
+        x, y = self._center_offset(text_layer, size)
+        background = 'color=c=0x{:02x}{:02x}{:02x}:s={}x{}:r={}:d={}'.format(*bg_color, *size, fps, duration)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            layer_path = os.path.join(tmp_dir, "text.png")
+            # A temporary file read once, so favour speed over size
+            text_layer.save(layer_path, compress_level=1)
+            command = [
+                imageio_ffmpeg.get_ffmpeg_exe(), '-y',
+                '-f', 'lavfi', '-i', background,
+                '-i', layer_path,
+                '-filter_complex', f'[0:v][1:v]overlay={x}:{y}',
+                '-t', str(duration),
+                '-pix_fmt', 'yuv420p'
+            ]
             
-            # Center text horizontally
-            x = (size[0] - text_width) // 2
-            y = start_y + i * line_height
+            # Prefer the GPU / media engine encoder; the ffmpeg build or driver may still
+            # lack it, in which case encode again in software
+            hardware_encoder = _hardware_encoder()
+            if hardware_encoder:
+                try:
+                    subprocess.run(command + list(hardware_encoder) + [output_path],
+                                   check=True, capture_output=True)
+                    return
+                except subprocess.CalledProcessError:
+                    pass
             
-            draw.text((x, y), line, fill=text_color, font=font)
-        
-        # Convert PIL image to numpy array
-        img_array = np.array(img)
-        
-        # Create video clip from image (no fade effects)
-        return ImageClip(img_array, duration=duration)
+            subprocess.run(command + SOFTWARE_ENCODER + [output_path],
+                           check=True, capture_output=True)
+            
+            # Software encoding worked with the same inputs, so the hardware encoder was the problem
+            if hardware_encoder:
+                _mark_hardware_encoder_unusable(hardware_encoder)
     
     def generate_video(self, topic, script, scenes, output_filename=None):
         """Generate a simple video with text scenes"""
@@ -75,40 +188,34 @@ class SimpleVideoGenerator:
         
         output_path = os.path.join(self.output_dir, output_filename)
         
-        # Create clips for each scene
-        clips = []
-        
         # ONLY show the topic - no bullet points, no content scenes
-        title_clip = self.create_text_clip(
+        duration = 5  # Show topic for 5 seconds
+        title_layer = self.render_text_layer(
             topic,
-            duration=5,  # Show topic for 5 seconds
-            bg_color=(20, 30, 60),
             font_size=90,
             is_title=True
         )
-        clips.append(title_clip)
-        
-        # That's it! Just the topic, nothing else
-        final_video = clips[0]  # Only one clip - the topic
-        
-        # Write video file
-        final_video.write_videofile(
-            output_path,
-            fps=24,
-            codec='libx264',
-            audio=False,
-            preset='ultrafast'
-        )
         
-        # Clean up
-        final_video.close()
+        # A single static scene, so encode it directly instead of going through MoviePy
+        self.write_text_video(title_layer, duration, output_path, bg_color=(20, 30, 60))
         
         return {
             'video_path': output_path,
-            'duration': final_video.duration,
+            'duration': duration,
             'scene_count': 1  # Only the topic
         }
     
+    def generate_videos_batch(self, jobs):
+        """Generate one video per (topic, script, scenes) job, in parallel processes"""
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        
+        # Text rendering and encoding are CPU-bound, so spread the topics across cores
+        worker = functools.partial(_generate_video_job, self.output_dir)
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(jobs))) as executor:
+            return list(executor.map(worker, jobs))
+    
     def generate_from_analysis(self, topic, script, pattern_analysis):
         """Generate video from pattern analysis"""
         scenes = pattern_analysis.get('recommended_scenes', [])
@@ -127,3 +234,9 @@ class SimpleVideoGenerator:
             ]
         
         return self.generate_video(topic, script, scenes)
+
+
+def _generate_video_job(output_dir, job):
+    """Process pool entry point; each worker builds its own generator"""
+    topic, script, scenes = job
+    return SimpleVideoGenerator(output_dir).generate_video(topic, script, scenes)